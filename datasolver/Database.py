@@ -15,14 +15,170 @@ Gerencia conexões com múltiplos bancos de dados usando SQLAlchemy.
 
 """
 
+import re
+import sys
+from asyncio import gather
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from importlib import util
-from typing import Dict, List, Optional
-
-from pydantic import BaseModel, ValidationError, conint, constr
+from threading import Lock
+from types import MappingProxyType
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    AsyncIterator,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+    ValidationError,
+    computed_field,
+    field_validator,
+)
 from sqlalchemy import create_engine
 from sqlalchemy.engine import URL, Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.orm.session import Session
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    NullPool,
+    QueuePool,
+    SingletonThreadPool,
+    StaticPool,
+)
+
+_PSYCOPG2_CONNECT_ARGS = MappingProxyType({
+    'connect_timeout': 10,
+    'keepalives': 1,
+    'keepalives_idle': 30,
+})
+
+
+@lru_cache(maxsize=None)
+def _verify_dialect(extra: str, dialect: str, packages: FrozenSet[str]):
+    """
+    🔍 **Procura os drivers do dialeto uma única vez por combinação.**
+
+    📝 Basta um dos pacotes estar instalado. O `find_spec` percorre o
+    sistema de arquivos; como os drivers não são desinstalados em tempo de
+    execução, o resultado pode ser reaproveitado.
+    """
+    if packages and all(util.find_spec(p) is None for p in packages):
+        install_cmd = f'pip install datasolver[{extra}]'
+        raise ImportError(
+            f"⚠️ Driver necessário: {' ou '.join(sorted(packages))}\n"
+            f"💡 Instale com: {install_cmd}\n"
+            f"🛠️ Dialeto usado: {dialect}"
+        )
+
+
+_INSERT_VALUES = re.compile(
+    r'\s*(?P<prefix>INSERT\s+INTO\s+.+?\s+VALUES)\s*(?P<values>.*)',
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _values_tuples(values: str) -> Optional[str]:
+    """
+    🧮 **Confere se o texto é só uma lista de tuplas `(...), (...)`.**
+
+    📝 Respeita parênteses aninhados e aspas, e aceita um `;` final.
+    Qualquer outra coisa fora das tuplas (`ON CONFLICT`, `RETURNING`, um
+    segundo comando) devolve `None`, e o insert não é agrupado.
+    """
+    values = values.rstrip()
+    if values.endswith(';'):
+        values = values[:-1].rstrip()
+
+    depth, quote, escaped, expect_tuple = 0, None, False, True
+    for char in values:
+        if quote:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == quote:
+                quote = None
+        elif depth:
+            if char in ("'", '"'):
+                quote = char
+            elif char == '(':
+                depth += 1
+            elif char == ')':
+                depth -= 1
+        elif char == '(' and expect_tuple:
+            depth, expect_tuple = 1, False
+        elif char == ',' and not expect_tuple:
+            expect_tuple = True
+        elif not char.isspace():
+            return None
+
+    if depth or quote or expect_tuple:
+        return None
+    return values
+
+
+def _merge_inserts(
+    statements: Iterable[str], max_bytes: int, max_rows: Optional[int] = None
+) -> Iterator[str]:
+    """
+    📦 **Agrupa `INSERT ... VALUES` consecutivos da mesma tabela.**
+
+    📝 Inserts com o mesmo prefixo (`INSERT INTO t (...) VALUES`) viram um
+    único insert com várias linhas, até `max_bytes` bytes (UTF-8) ou
+    `max_rows` grupos de valores. Outros comandos, e inserts com algo além
+    das tuplas de valores, são repassados sem alteração e na ordem.
+    """
+    prefix, rows, size = None, [], 0
+    for statement in statements:
+        match = _INSERT_VALUES.fullmatch(statement)
+        values = match and _values_tuples(match['values'])
+        if not values:
+            if rows:
+                yield f"{prefix} {', '.join(rows)}"
+                prefix, rows, size = None, [], 0
+            yield statement
+            continue
+
+        key = ' '.join(match['prefix'].split())
+        length = len(values.encode())
+        if rows and (
+            key != prefix
+            or size + length + 2 > max_bytes
+            or len(rows) == max_rows
+        ):
+            yield f"{prefix} {', '.join(rows)}"
+            rows = []
+        if not rows:
+            # `- 1`: o primeiro grupo vem após um espaço, não após ', '.
+            prefix, size = key, len(key.encode()) - 1
+        rows.append(values)
+        size += length + 2
+
+    if rows:
+        yield f"{prefix} {', '.join(rows)}"
 
 
 class DatabaseConfig(BaseModel):
@@ -38,9 +194,9 @@ class DatabaseConfig(BaseModel):
     - Fácil integração com SQLAlchemy 🐍  
 
     **Exemplos de Dialetos:**  
-    - 🐘 PostgreSQL: `postgresql+psycopg2`  
+    - 🐘 PostgreSQL: `postgresql+psycopg2` ou `postgresql+psycopg`  
     - 🐬 MySQL: `mysql+pymysql`  
-    - 🏺 Oracle: `oracle+cx_oracle`  
+    - 🏺 Oracle: `oracle+cx_oracle` ou `oracle+oracledb`  
     - 🏰 SQL Server: `mssql+pyodbc`  
     - 🧪 SQLite: `sqlite://`  
 
@@ -50,18 +206,114 @@ class DatabaseConfig(BaseModel):
     pip install datasolver[mysql]       # MySQL
     pip install datasolver[oracle]      # Oracle
     pip install datasolver[mssql]       # SQL Server
+    pip install datasolver[async]       # Drivers assíncronos
     ```
+
+    🏊 **Pool de conexões:**
+    `pool_size`, `max_overflow`, `pool_timeout`, `pool_recycle` e
+    `pool_pre_ping` são repassados à engine. Use `max_overflow=-1` para
+    nunca bloquear à espera de uma conexão livre.
+
+    `poolclass` escolhe o pool: `queue` (padrão), `null` ou `static`.
+    Com `null` nenhuma conexão fica ociosa aberta, ao custo de conectar a
+    cada uso — ideal para scripts curtos e funções serverless.
+
+    🔧 **Parâmetros extras da URL:**
+    `query` repassa opções do driver na URL, como `application_name`,
+    `connect_timeout` ou `sslmode`.
+
+    🔌 **Opções do driver e de execução:**
+    `connect_args` vai direto para o driver (ex.: `statement_timeout`,
+    `tcp_user_timeout`, `server_settings` do asyncpg) e sobrescreve os
+    timeouts/keepalive padrão; `execution_options` vale para toda a engine.
+
+    🧠 **Cache de SQL compilado:**
+    `query_cache_size` define quantos comandos compilados cada engine
+    guarda. Aumente para muitas consultas distintas; reduza quando houver
+    muitas engines e memória for a prioridade.
+
+    ⚡ **Modo assíncrono (`async_mode=True`):**
+    Drivers só síncronos são trocados automaticamente pelo equivalente
+    assíncrono (ex.: `postgresql+psycopg2` → `postgresql+asyncpg`);
+    drivers que já suportam asyncio (ex.: `postgresql+psycopg`) são mantidos.
     """
 
-    name: constr(min_length=3, max_length=50)
+    model_config = ConfigDict(frozen=True)
+
+    name: Annotated[str, StringConstraints(min_length=3, max_length=50)]
     dialect: str
     database: str
     username: Optional[str] = None
     password: Optional[str] = None
     host: Optional[str] = None
-    port: Optional[conint(gt=0, lt=65536)] = None
-    pool_size: conint(gt=0) = 5
-    max_overflow: conint(ge=0) = 10
+    port: Optional[Annotated[int, Field(gt=0, lt=65536)]] = None
+    query: Dict[str, str] = {}
+    connect_args: Dict[str, Any] = {}
+    execution_options: Dict[str, Any] = {}
+    pool_size: Annotated[int, Field(gt=0)] = 5
+    max_overflow: Annotated[int, Field(ge=-1)] = 10
+    pool_pre_ping: bool = True
+    pool_recycle: Annotated[int, Field(gt=0)] = 3600
+    pool_timeout: Annotated[int, Field(gt=0)] = 30
+    query_cache_size: Annotated[int, Field(ge=0)] = 500
+    poolclass: Optional[Literal['queue', 'null', 'static']] = None
+    async_mode: bool = False
+
+    @field_validator('dialect')
+    @classmethod
+    def _intern_dialect(cls, dialect: str) -> str:
+        """🧷 **Compartilha a mesma string entre configs do mesmo dialeto.**"""
+        return sys.intern(dialect)
+
+    @computed_field
+    @cached_property
+    def base_dialect(self) -> str:
+        """🎯 **Dialeto base, sem o driver (ex.: `postgresql`).**"""
+        return sys.intern(self.dialect.partition('+')[0].lower())
+
+    @cached_property
+    def url(self) -> URL:
+        """🔗 **URL SQLAlchemy da conexão, montada uma única vez.**"""
+        return URL.create(
+            drivername=self.dialect,
+            username=self.username,
+            password=self.password,
+            host=self.host,
+            port=self.port,
+            database=self.database,
+            query=self.query,
+        )
+
+
+@dataclass(slots=True)
+class _ConnEntry:
+    """
+    📇 **Registro interno de uma conexão.**
+
+    📝 `engine` e `session_factory` ficam vazios até o primeiro uso.
+    """
+
+    config: DatabaseConfig
+    engine: Optional[Union[Engine, AsyncEngine]] = None
+    session_factory: Optional[
+        Union[scoped_session, async_sessionmaker]
+    ] = None
+    lock: Lock = field(default_factory=Lock)
+
+
+@dataclass(slots=True)
+class _RequestScope:
+    """
+    🧭 **Sessões de uma requisição aberta com `request_scope`.**
+
+    📝 Sessões assíncronas só entram em escopos abertos com `async with`,
+    onde podem ser fechadas com `await`.
+    """
+
+    is_async: bool
+    sessions: Dict[str, Union[Session, AsyncSession]] = field(
+        default_factory=dict
+    )
 
 
 class DatabaseConnectionManager:
@@ -92,15 +344,76 @@ class DatabaseConnectionManager:
     with manager.get_session('meu_banco') as sessao:
         sessao.execute('SELECT 1')
     ```
+
+    ⚡ **Exemplo assíncrono:**  
+    ```python
+    manager = DatabaseConnectionManager([{**config, 'async_mode': True}])
+    async with manager.get_async_session('meu_banco') as sessao:
+        await sessao.execute(text('SELECT 1'))
+    await manager.aclose_all_connections()
+    ```
+
+    🧭 **Sessões por requisição:**  
+    Dentro de `request_scope()`, `get_session` devolve a mesma sessão em
+    toda a requisição (inclusive entre middlewares e tarefas asyncio
+    criadas nela), e todas são fechadas ao sair do bloco:
+    ```python
+    with manager.request_scope():
+        sessao = manager.get_request_session('meu_banco')
+        ...
+    ```
+    Fora de um escopo, a sessão é da thread atual; feche-a com
+    `close_request_session()`. Em código assíncrono, use
+    `async with manager.arequest_scope():`, que também compartilha as
+    sessões de `get_async_session`.
     """
 
-    DIALECT_REQUIREMENTS = {
-        'mysql': ['pymysql'],
-        'postgresql': ['psycopg2'],
-        'oracle': ['cx_oracle'],
-        'mssql': ['pyodbc'],
-        'sqlite': [],
-    }
+    DIALECT_REQUIREMENTS = MappingProxyType({
+        'mysql': frozenset({'pymysql'}),
+        'postgresql': frozenset({'psycopg2', 'psycopg'}),
+        'oracle': frozenset({'cx_Oracle', 'oracledb'}),
+        'mssql': frozenset({'pyodbc'}),
+        'sqlite': frozenset(),
+    })
+
+    ASYNC_DIALECTS = MappingProxyType({
+        'mysql': 'mysql+aiomysql',
+        'mysql+pymysql': 'mysql+aiomysql',
+        'mysql+mysqldb': 'mysql+aiomysql',
+        'postgresql': 'postgresql+asyncpg',
+        'postgresql+psycopg2': 'postgresql+asyncpg',
+        'oracle': 'oracle+oracledb',
+        'oracle+cx_oracle': 'oracle+oracledb',
+        'mssql': 'mssql+aioodbc',
+        'mssql+pyodbc': 'mssql+aioodbc',
+        'sqlite': 'sqlite+aiosqlite',
+        'sqlite+pysqlite': 'sqlite+aiosqlite',
+    })
+
+    ASYNC_DIALECT_REQUIREMENTS = MappingProxyType({
+        'mysql+aiomysql': frozenset({'aiomysql'}),
+        'mysql+asyncmy': frozenset({'asyncmy'}),
+        'postgresql+asyncpg': frozenset({'asyncpg'}),
+        'postgresql+psycopg': frozenset({'psycopg'}),
+        'postgresql+psycopg_async': frozenset({'psycopg'}),
+        'oracle+oracledb': frozenset({'oracledb'}),
+        'mssql+aioodbc': frozenset({'aioodbc'}),
+        'sqlite+aiosqlite': frozenset({'aiosqlite'}),
+    })
+
+    DEFAULT_CONNECT_ARGS = MappingProxyType({
+        'postgresql': _PSYCOPG2_CONNECT_ARGS,
+        'postgresql+psycopg2': _PSYCOPG2_CONNECT_ARGS,
+        'postgresql+asyncpg': MappingProxyType({'timeout': 10}),
+        'mysql+pymysql': MappingProxyType({'connect_timeout': 10}),
+    })
+
+    MULTI_ROW_INSERT_LIMITS = MappingProxyType({
+        'mssql': 1000,
+        'oracle': 1,
+    })
+
+    _CONFIG_ADAPTER = TypeAdapter(List[DatabaseConfig])
 
     def __init__(self, configs: List[Dict]):
         """
@@ -114,6 +427,7 @@ class DatabaseConnectionManager:
 
         ⚠️ **Possíveis exceções:**  
         - `ValueError`: Se a configuração estiver incorreta.  
+        - `ValueError`: Se houver nomes de conexão repetidos.  
         - `ImportError`: Se o driver necessário não estiver instalado.  
 
         📝 **Dica:** Para instalar os drivers, use:  
@@ -121,15 +435,42 @@ class DatabaseConnectionManager:
         pip install datasolver[dialeto]
         ```
         """
-        self.connections: Dict[str, Dict] = {}
+        self.connections: Dict[str, _ConnEntry] = {}
         self.configs: List[DatabaseConfig] = []
+        self._session_getters: Dict[str, Callable[[], Session]] = {}
+        self._request_scope: ContextVar[Optional[_RequestScope]] = ContextVar(
+            '_request_scope', default=None
+        )
+        self._mutation_lock = Lock()
+
+        self.add_connections(configs)
 
-        for config in configs:
-            try:
-                validated_config = DatabaseConfig(**config)
-                self.add_connection(validated_config)
-            except ValidationError as e:
-                raise ValueError(f'⚠️ Configuração inválida: {e}') from e
+    def add_connections(self, configs: List[Dict]):
+        """
+        ➕ **Adiciona várias conexões de uma vez**
+
+        📝 Todas as configurações são validadas, os nomes conferidos entre
+        si e contra as conexões já registradas, e os drivers verificados,
+        antes de registrar qualquer uma.
+
+        🛠️ **Parâmetros:**  
+        - `configs` (List[Dict]): Lista de configurações de conexão.  
+
+        ⚠️ **Possíveis exceções:**  
+        - `ValueError`: Se a configuração estiver incorreta.  
+        - `ValueError`: Se houver nomes de conexão repetidos.  
+        - `ImportError`: Se o driver necessário não estiver instalado.  
+        """
+        try:
+            validated = self._CONFIG_ADAPTER.validate_python(configs)
+        except ValidationError as e:
+            raise ValueError(f'⚠️ Configuração inválida: {e}') from e
+
+        self._check_unique_names([config.name for config in validated])
+        for validated_config in validated:
+            self._check_driver_installation(validated_config)
+        for validated_config in validated:
+            self.add_connection(validated_config)
 
     def add_connection(self, config: DatabaseConfig):
         """
@@ -142,70 +483,406 @@ class DatabaseConnectionManager:
         - `ImportError`: Se o driver necessário não estiver instalado.  
         - `ValueError`: Se o nome da conexão já existir.  
         """
-        if config.name in self.connections:
-            raise ValueError(f"⚠️ A conexão '{config.name}' já existe! Escolha outro nome.")
-
-        self._check_driver_installation(config.dialect)
-        connection_url = self._build_connection_url(config)
-        engine = create_engine(connection_url)
-
-        self.connections[config.name] = {
-            'engine': engine,
-            'session_factory': scoped_session(sessionmaker(bind=engine)),
-        }
-        self.configs.append(config)
+        self._check_driver_installation(config)
+        entry = _ConnEntry(config)
+
+        with self._mutation_lock:
+            if config.name in self.connections:
+                raise ValueError(
+                    f"⚠️ A conexão '{config.name}' já existe! "
+                    "Escolha outro nome."
+                )
+            self.connections[config.name] = entry
+            self.configs.append(config)
 
     def get_session(self, name: str) -> Session:
         """🔄 **Obtém uma sessão ativa para consultas e transações.**"""
-        if name not in self.connections:
-            raise ValueError(f"⚠️ Conexão '{name}' não encontrada.")
-        return self.connections[name]['session_factory']()
+        return self.get_request_session(name)
+
+    def get_request_session(self, name: str) -> Session:
+        """
+        🧭 **Obtém a sessão da requisição atual.**
+
+        📝 Dentro de `request_scope()`, chamadas repetidas devolvem a mesma
+        sessão até o fim do bloco. Fora dele, a sessão é a da thread atual,
+        até `close_request_session` ser chamado.
+        """
+        scope = self._request_scope.get()
+        if scope is None:
+            getter = self._session_getters.get(name)
+            if getter is not None:
+                return getter()
+        elif name in scope.sessions:
+            return scope.sessions[name]
+
+        entry = self._materialize(name)
+        if entry.config.async_mode:
+            raise ValueError(
+                f"⚠️ A conexão '{name}' é assíncrona. Use get_async_session."
+            )
+        if scope is None:
+            return entry.session_factory()
+
+        session = entry.session_factory.session_factory()
+        scope.sessions[name] = session
+        return session
+
+    @contextmanager
+    def request_scope(self) -> Iterator[None]:
+        """
+        🧭 **Abre um escopo de requisição para as sessões síncronas.**
+
+        📝 As sessões obtidas dentro do bloco ficam no contexto atual
+        (`ContextVar` deste gerenciador) e são fechadas ao sair dele.
+        """
+        token = self._request_scope.set(_RequestScope(is_async=False))
+        try:
+            yield
+        finally:
+            scope = self._request_scope.get()
+            self._request_scope.reset(token)
+            for session in scope.sessions.values():
+                session.close()
+
+    @asynccontextmanager
+    async def arequest_scope(self) -> AsyncIterator[None]:
+        """
+        🧭 **Abre um escopo de requisição, inclusive para sessões async.**
+
+        📝 Dentro do bloco, `get_session` e `get_async_session` devolvem a
+        mesma sessão por conexão, inclusive entre middlewares e tarefas
+        asyncio criadas nele. Todas são fechadas ao sair.
+
+        ⚠️ Uma `AsyncSession` não pode ser usada por tarefas simultâneas;
+        compartilhe-a apenas entre etapas sequenciais da requisição.
+        """
+        token = self._request_scope.set(_RequestScope(is_async=True))
+        try:
+            yield
+        finally:
+            scope = self._request_scope.get()
+            self._request_scope.reset(token)
+            await self._close_scope_sessions(scope)
+
+    def get_async_session(self, name: str) -> AsyncSession:
+        """
+        ⚡ **Obtém uma sessão assíncrona para consultas e transações.**
 
-    def get_engine(self, name: str) -> Engine:
+        📝 Dentro de `arequest_scope()`, chamadas repetidas devolvem a mesma
+        sessão até o fim do bloco. Fora dele, cada chamada cria uma sessão
+        nova, que deve ser usada com `async with` para ser fechada ao final.
+        """
+        scope = self._request_scope.get()
+        if scope is not None and name in scope.sessions:
+            return scope.sessions[name]
+
+        entry = self._materialize(name)
+        if not entry.config.async_mode:
+            raise ValueError(
+                f"⚠️ A conexão '{name}' não é assíncrona. Use get_session."
+            )
+        session = entry.session_factory()
+        if scope is not None and scope.is_async:
+            scope.sessions[name] = session
+        return session
+
+    def get_engine(self, name: str) -> Union[Engine, AsyncEngine]:
         """🛠️ **Obtém a engine SQLAlchemy de uma conexão específica.**"""
-        if name not in self.connections:
-            raise ValueError(f"⚠️ Conexão '{name}' não encontrada.")
-        return self.connections[name]['engine']
+        return self._materialize(name).engine
+
+    def execute_many(
+        self, name: str, statements: Iterable[str], max_bytes: int = 1_000_000
+    ):
+        """
+        📦 **Executa vários comandos SQL em lote, numa única transação.**
+
+        📝 Inserts consecutivos na mesma tabela são unidos em um só
+        `INSERT ... VALUES (...), (...)` de até `max_bytes` bytes (UTF-8),
+        trocando N idas ao banco por poucas.
+
+        🛠️ **Parâmetros:**  
+        - `name` (str): Nome da conexão.  
+        - `statements` (Iterable[str]): Comandos SQL completos, sem parâmetros.  
+        - `max_bytes` (int): Tamanho máximo de cada comando agrupado.  
+        """
+        entry = self._materialize(name)
+        if entry.config.async_mode:
+            raise ValueError(
+                f"⚠️ A conexão '{name}' é assíncrona. Use aexecute_many."
+            )
+
+        max_rows = self.MULTI_ROW_INSERT_LIMITS.get(entry.config.base_dialect)
+        with entry.engine.begin() as connection:
+            for statement in _merge_inserts(statements, max_bytes, max_rows):
+                connection.exec_driver_sql(statement)
+
+    async def aexecute_many(
+        self, name: str, statements: Iterable[str], max_bytes: int = 1_000_000
+    ):
+        """📦 **Versão assíncrona de `execute_many`.**"""
+        entry = self._materialize(name)
+        if not entry.config.async_mode:
+            raise ValueError(
+                f"⚠️ A conexão '{name}' não é assíncrona. Use execute_many."
+            )
+
+        max_rows = self.MULTI_ROW_INSERT_LIMITS.get(entry.config.base_dialect)
+        async with entry.engine.begin() as connection:
+            for statement in _merge_inserts(statements, max_bytes, max_rows):
+                await connection.exec_driver_sql(statement)
+
+    def close_request_session(self):
+        """🧹 **Fecha as sessões síncronas da requisição ou thread atual.**"""
+        scope = self._request_scope.get()
+        if scope is not None:
+            for session in scope.sessions.values():
+                if isinstance(session, Session):
+                    session.close()
+
+        for entry in list(self.connections.values()):
+            if entry.engine is not None and not entry.config.async_mode:
+                entry.session_factory.remove()
+
+    async def aclose_request_session(self):
+        """🧹 **Fecha as sessões da requisição atual, inclusive assíncronas.**"""
+        scope = self._request_scope.get()
+        if scope is not None:
+            await self._close_scope_sessions(scope)
+        self.close_request_session()
+
+    async def _close_scope_sessions(self, scope: _RequestScope):
+        """🧹 **Fecha as sessões de um escopo, aguardando as assíncronas.**"""
+        for session in scope.sessions.values():
+            if isinstance(session, AsyncSession):
+                await session.close()
+            else:
+                session.close()
 
     def close_all_connections(self):
-        """❌ **Fecha todas as conexões abertas de forma segura.**"""
-        for name in list(self.connections.keys()):
-            self.connections[name]['engine'].dispose()
-            self.connections[name]['session_factory'].close_all()
-            self.connections[name]['session_factory'].remove()
-            del self.connections[name]
-
-    def _build_connection_url(self, config: DatabaseConfig) -> str:
-        """🔗 **Constrói a URL de conexão SQLAlchemy.**"""
-        return URL.create(
-            drivername=config.dialect,
-            username=config.username,
-            password=config.password,
-            host=config.host,
-            port=config.port,
-            database=config.database,
-        )
+        """
+        ❌ **Fecha todas as conexões abertas de forma segura.**
 
-    def _check_driver_installation(self, dialect: str):
+        ⚠️ Engines assíncronas apenas descartam o pool; para fechá-las de
+        forma limpa, use `aclose_all_connections`.
         """
-        🔍 **Verifica se os pacotes necessários para o dialeto estão instalados.**
+        self.close_request_session()
+        with self._mutation_lock:
+            connections, self.connections = self.connections, {}
+            self._session_getters = {}
+
+        engines = []
+        for entry in connections.values():
+            if entry.engine is None:
+                continue
+            if entry.config.async_mode:
+                entry.engine.sync_engine.dispose(close=False)
+            else:
+                engines.append(entry.engine)
+
+        self._dispose_engines(engines)
+
+    async def aclose_all_connections(self):
+        """❌ **Fecha todas as conexões, aguardando as engines assíncronas.**"""
+        await self.aclose_request_session()
+        with self._mutation_lock:
+            connections, self.connections = self.connections, {}
+            self._session_getters = {}
+
+        engines, async_entries = [], []
+        for entry in connections.values():
+            if entry.engine is None:
+                continue
+            if entry.config.async_mode:
+                async_entries.append(entry)
+            else:
+                engines.append(entry.engine)
+
+        await gather(*(entry.engine.dispose() for entry in async_entries))
+        self._dispose_engines(engines)
+
+    def _dispose_engines(self, engines: List[Engine]):
+        """
+        🧵 **Descarta várias engines síncronas em paralelo.**
 
-        ⚠️ **Se um driver estiver ausente, sugere o comando de instalação.**
+        📝 Cada `dispose` espera o fechamento das conexões do pool; em
+        paralelo, o tempo total é o da engine mais lenta, não a soma.
+        Pools presos à thread (SQLite em memória) são descartados aqui mesmo.
+        """
+        pooled = []
+        for engine in engines:
+            if isinstance(engine.pool, SingletonThreadPool):
+                engine.dispose()
+            else:
+                pooled.append(engine)
+        if not pooled:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(32, len(pooled))) as pool:
+            futures = [pool.submit(engine.dispose) for engine in pooled]
+
+        for future in futures:
+            future.result()
+
+    def _check_unique_names(self, names: List[str]):
+        """
+        🏷️ **Garante que nenhum nome se repita antes de registrar conexões.**
+
+        ⚠️ Lista de uma vez todos os nomes repetidos entre si ou já
+        registrados no gerenciador.
+        """
+        seen = set(self.connections)
+        duplicates = []
+        for name in names:
+            if name in seen and name not in duplicates:
+                duplicates.append(name)
+            seen.add(name)
+
+        if duplicates:
+            raise ValueError(
+                f"⚠️ Conexões duplicadas: {', '.join(duplicates)}. "
+                "Escolha outros nomes."
+            )
+
+    def _get_entry(self, name: str) -> _ConnEntry:
+        """🔎 **Busca o registro da conexão, com erro amigável se não existir.**"""
+        entry = self.connections.get(name)
+        if entry is None:
+            raise ValueError(f"⚠️ Conexão '{name}' não encontrada.")
+        return entry
+
+    def _materialize(self, name: str) -> _ConnEntry:
         """
-        base_dialect = dialect.split('+')[0].lower()
-        required = self.DIALECT_REQUIREMENTS.get(base_dialect, [])
+        💤 **Cria a engine e a fábrica de sessões no primeiro uso.**
 
-        for package in required:
-            if not util.find_spec(package):
-                install_cmd = f'pip install datasolver[{base_dialect}]'
-                raise ImportError(
-                    f"⚠️ Driver necessário: {package}\n"
-                    f"💡 Instale com: {install_cmd}\n"
-                    f"🛠️ Dialeto usado: {dialect}"
+        📝 Conexões registradas mas nunca usadas não abrem pool nem carregam
+        o dialeto. O lock por conexão evita engines duplicadas quando várias
+        threads fazem o primeiro acesso ao mesmo tempo.
+        """
+        entry = self._get_entry(name)
+        if entry.engine is not None:
+            return entry
+
+        with entry.lock:
+            if entry.engine is not None:
+                return entry
+
+            config = entry.config
+            connection_url = self._build_connection_url(config)
+            options = self._engine_options(config, connection_url)
+            if config.async_mode:
+                engine = create_async_engine(connection_url, **options)
+                session_factory = async_sessionmaker(
+                    engine, expire_on_commit=False, class_=AsyncSession
                 )
+            else:
+                engine = create_engine(connection_url, **options)
+                session_factory = scoped_session(sessionmaker(bind=engine))
+
+            entry.session_factory = session_factory
+            entry.engine = engine
+            if not config.async_mode:
+                with self._mutation_lock:
+                    if self.connections.get(name) is entry:
+                        self._session_getters[name] = session_factory
+        return entry
+
+    def _build_connection_url(self, config: DatabaseConfig) -> URL:
+        """🔗 **Obtém a URL de conexão SQLAlchemy.**"""
+        if config.async_mode:
+            return config.url.set(drivername=self._async_dialect(config))
+        return config.url
+
+    def _async_dialect(self, config: DatabaseConfig) -> str:
+        """
+        ⚡ **Escolhe o dialeto usado no modo assíncrono.**
+
+        📝 Só drivers exclusivamente síncronos (ou o dialeto sem driver) são
+        trocados; drivers que já suportam asyncio, como `psycopg` ou
+        `asyncmy`, são mantidos.
+        """
+        return self.ASYNC_DIALECTS.get(config.dialect.lower(), config.dialect)
+
+    def _engine_options(
+        self, config: DatabaseConfig, connection_url: URL
+    ) -> Dict:
+        """
+        🏊 **Monta os parâmetros da engine e do pool de conexões.**
+
+        📝 Os `connect_args` padrão do driver (timeouts e keepalive) são
+        combinados com os da configuração, que têm prioridade. Um padrão
+        também é ignorado quando a mesma chave vem em `query`, já que o
+        SQLAlchemy aplica `connect_args` por cima dos parâmetros da URL.
+
+        📝 O SQLite em memória usa um pool de conexão única, então não
+        recebe `pool_size`, `max_overflow` nem `pool_timeout`, a menos que
+        `poolclass='queue'` seja pedido explicitamente. SQLite em arquivo
+        usa `QueuePool` e recebe os parâmetros normalmente.
+        """
+        in_memory_sqlite = config.base_dialect == 'sqlite' and (
+            config.database in ('', ':memory:')
+            or config.query.get('mode') == 'memory'
+        )
+        options = {
+            'pool_pre_ping': config.pool_pre_ping,
+            'pool_recycle': config.pool_recycle,
+            'connect_args': {
+                **{
+                    key: value
+                    for key, value in self.DEFAULT_CONNECT_ARGS.get(
+                        connection_url.drivername, {}
+                    ).items()
+                    if key not in config.query
+                },
+                **config.connect_args,
+            },
+            'execution_options': config.execution_options,
+            'query_cache_size': config.query_cache_size,
+        }
+        if config.poolclass == 'null':
+            options['poolclass'] = NullPool
+        elif config.poolclass == 'static':
+            options['poolclass'] = StaticPool
+        elif config.poolclass == 'queue' or not in_memory_sqlite:
+            if config.poolclass == 'queue':
+                options['poolclass'] = (
+                    AsyncAdaptedQueuePool if config.async_mode else QueuePool
+                )
+            options.update(
+                pool_size=config.pool_size,
+                max_overflow=config.max_overflow,
+                pool_timeout=config.pool_timeout,
+            )
+        return options
+
+    def _check_driver_installation(self, config: DatabaseConfig):
+        """
+        🔍 **Verifica se os pacotes necessários para o dialeto estão instalados.**
+
+        ⚠️ **Se um driver estiver ausente, sugere o comando de instalação.**
+        """
+        if config.async_mode:
+            dialect = self._async_dialect(config)
+            required = self.ASYNC_DIALECT_REQUIREMENTS.get(
+                dialect.lower(), frozenset()
+            )
+            extra = 'async'
+        else:
+            dialect = config.dialect
+            required = self.DIALECT_REQUIREMENTS.get(
+                config.base_dialect, frozenset()
+            )
+            extra = config.base_dialect
+
+        _verify_dialect(extra, dialect, required)
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close_all_connections()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose_all_connections()
@@ -0,0 +1,305 @@
+import asyncio
+import gc
+import importlib.util
+from threading import Thread
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.pool import SingletonThreadPool
+
+from datasolver.Database import (
+    DatabaseConfig,
+    DatabaseConnectionManager,
+    _merge_inserts,
+)
+
+
+def test_merge_inserts_joins_same_table_rows():
+    statements = [
+        'INSERT INTO t (a, b) VALUES (1, \'x\');',
+        'INSERT INTO t (a, b)  VALUES (2, \'y\'), (3, \'z\')',
+    ]
+
+    assert list(_merge_inserts(statements, 1_000)) == [
+        "INSERT INTO t (a, b) VALUES (1, 'x'), (2, 'y'), (3, 'z')"
+    ]
+
+
+def test_merge_inserts_flushes_when_prefix_changes():
+    statements = [
+        'INSERT INTO t (a) VALUES (1)',
+        'INSERT INTO u (a) VALUES (2)',
+        'INSERT INTO u (a) VALUES (3)',
+    ]
+
+    assert list(_merge_inserts(statements, 1_000)) == [
+        'INSERT INTO t (a) VALUES (1)',
+        'INSERT INTO u (a) VALUES (2), (3)',
+    ]
+
+
+def test_merge_inserts_flushes_at_max_bytes():
+    statements = [f'INSERT INTO t (a) VALUES ({i})' for i in range(3)]
+
+    assert list(_merge_inserts(statements, 33)) == [
+        'INSERT INTO t (a) VALUES (0), (1)',
+        'INSERT INTO t (a) VALUES (2)',
+    ]
+
+
+def test_merge_inserts_flushes_at_max_rows():
+    statements = [f'INSERT INTO t (a) VALUES ({i})' for i in range(3)]
+
+    assert list(_merge_inserts(statements, 1_000, max_rows=1)) == statements
+
+
+def test_merge_inserts_passes_through_conflict_and_returning():
+    statements = [
+        'INSERT INTO t (a) VALUES (1) ON CONFLICT (a) DO UPDATE SET a = (2)',
+        'INSERT INTO t (a) VALUES (3) RETURNING a',
+    ]
+
+    assert list(_merge_inserts(statements, 1_000)) == statements
+
+
+def test_merge_inserts_passes_through_multiple_statements():
+    statements = [
+        'INSERT INTO t (a) VALUES (1); DELETE FROM t WHERE (a=1)',
+        'INSERT INTO t (a) VALUES (2)',
+    ]
+
+    assert list(_merge_inserts(statements, 1_000)) == statements
+
+
+def test_merge_inserts_ignores_parentheses_inside_quotes():
+    statements = [
+        "INSERT INTO t (a) VALUES ('(1)), (x')",
+        "INSERT INTO t (a) VALUES ('it''s')",
+    ]
+
+    assert list(_merge_inserts(statements, 1_000)) == [
+        "INSERT INTO t (a) VALUES ('(1)), (x'), ('it''s')"
+    ]
+
+
+def test_merge_inserts_keeps_statement_order():
+    statements = [
+        'INSERT INTO t (a) VALUES (1)',
+        'INSERT INTO t (a) VALUES (2)',
+        'UPDATE t SET a = 0',
+        'INSERT INTO t (a) VALUES (3)',
+    ]
+
+    assert list(_merge_inserts(statements, 1_000)) == [
+        'INSERT INTO t (a) VALUES (1), (2)',
+        'UPDATE t SET a = 0',
+        'INSERT INTO t (a) VALUES (3)',
+    ]
+
+
+def test_file_sqlite_receives_pool_sizing(tmp_path):
+    manager = DatabaseConnectionManager([{
+        'name': 'arquivo',
+        'dialect': 'sqlite',
+        'database': str(tmp_path / 'dados.db'),
+        'pool_size': 20,
+        'max_overflow': 0,
+    }])
+
+    pool = manager.get_engine('arquivo').pool
+    assert (pool.size(), pool._max_overflow) == (20, 0)
+    manager.close_all_connections()
+
+
+def test_memory_sqlite_skips_pool_sizing():
+    manager = DatabaseConnectionManager([
+        {'name': 'memoria', 'dialect': 'sqlite', 'database': ':memory:'}
+    ])
+
+    assert isinstance(manager.get_engine('memoria').pool, SingletonThreadPool)
+    manager.close_all_connections()
+
+
+@pytest.mark.parametrize(
+    ('dialect', 'expected'),
+    [
+        ('postgresql+psycopg2', 'postgresql+asyncpg'),
+        ('postgresql', 'postgresql+asyncpg'),
+        ('postgresql+psycopg', 'postgresql+psycopg'),
+        ('mysql+asyncmy', 'mysql+asyncmy'),
+        ('sqlite', 'sqlite+aiosqlite'),
+    ],
+)
+def test_async_mode_only_replaces_sync_only_drivers(dialect, expected):
+    config = DatabaseConfig(
+        name='assincrono', dialect=dialect, database='x', async_mode=True
+    )
+
+    url = DatabaseConnectionManager([])._build_connection_url(config)
+    assert url.drivername == expected
+
+
+def _sqlite_manager(tmp_path, name='principal', **extra):
+    return DatabaseConnectionManager([{
+        'name': name,
+        'dialect': 'sqlite',
+        'database': str(tmp_path / f'{name}.db'),
+        **extra,
+    }])
+
+
+def test_request_scope_shares_and_closes_session(tmp_path):
+    manager = _sqlite_manager(tmp_path)
+    pool = manager.get_engine('principal').pool
+
+    with manager.request_scope():
+        session = manager.get_session('principal')
+        assert manager.get_request_session('principal') is session
+        session.execute(text('SELECT 1'))
+        assert pool.checkedout() == 1
+
+    assert pool.checkedout() == 0
+    assert manager.get_session('principal') is not session
+    manager.close_all_connections()
+
+
+def test_session_is_thread_local_outside_scope(tmp_path):
+    manager = _sqlite_manager(tmp_path)
+    pool = manager.get_engine('principal').pool
+    session_ids = set()
+
+    def worker():
+        session = manager.get_session('principal')
+        session.execute(text('SELECT 1'))
+        session_ids.add(id(session))
+
+    threads = [Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    gc.collect()
+
+    assert len(session_ids) == 3
+    assert manager.get_session('principal') is manager.get_session('principal')
+    assert pool.checkedout() == 0
+    manager.close_all_connections()
+
+
+def test_close_request_session_only_affects_its_manager(tmp_path):
+    first = _sqlite_manager(tmp_path, 'primeiro')
+    second = _sqlite_manager(tmp_path, 'segundo')
+    second_pool = second.get_engine('segundo').pool
+
+    with first.request_scope(), second.request_scope():
+        session = second.get_session('segundo')
+        session.execute(text('SELECT 1'))
+        first.close_request_session()
+        assert second.get_session('segundo') is session
+        assert second_pool.checkedout() == 1
+
+    assert second_pool.checkedout() == 0
+    first.close_all_connections()
+    second.close_all_connections()
+
+
+def test_arequest_scope_shares_async_session(tmp_path):
+    manager = _sqlite_manager(tmp_path, async_mode=True)
+    pool = manager.get_engine('principal').pool
+
+    async def middleware():
+        session = manager.get_async_session('principal')
+        await session.execute(text('SELECT 1'))
+        return session, await handler()
+
+    async def handler():
+        return manager.get_async_session('principal')
+
+    async def main():
+        async with manager.arequest_scope():
+            outer, inner = await middleware()
+            assert outer is inner
+            assert pool.checkedout() == 1
+        assert pool.checkedout() == 0
+        assert manager.get_async_session('principal') is not outer
+        await manager.aclose_all_connections()
+
+    asyncio.run(main())
+
+
+def test_merge_inserts_counts_max_bytes_in_utf8():
+    statements = ["INSERT INTO t (a) VALUES ('é')"] * 2
+    merged = "INSERT INTO t (a) VALUES ('é'), ('é')"
+
+    assert len(merged) < 38 < len(merged.encode())
+    assert list(_merge_inserts(statements, 38)) == statements
+
+
+def test_execute_many_runs_statements_in_order(tmp_path):
+    manager = _sqlite_manager(tmp_path)
+
+    manager.execute_many('principal', [
+        'CREATE TABLE t (a INTEGER PRIMARY KEY, b TEXT)',
+        "INSERT INTO t (a, b) VALUES (1, 'x:1')",
+        "INSERT INTO t (a, b) VALUES (2, 'x:2')",
+        'DELETE FROM t WHERE a = 1',
+        "INSERT INTO t (a, b) VALUES (3, 'x:3')",
+    ])
+
+    with manager.get_engine('principal').connect() as connection:
+        rows = connection.execute(text('SELECT a, b FROM t ORDER BY a'))
+        assert rows.all() == [(2, 'x:2'), (3, 'x:3')]
+    manager.close_all_connections()
+
+
+def test_execute_many_rolls_back_on_failure(tmp_path):
+    manager = _sqlite_manager(tmp_path)
+    manager.execute_many(
+        'principal', ['CREATE TABLE t (a INTEGER PRIMARY KEY)']
+    )
+
+    with pytest.raises(IntegrityError):
+        manager.execute_many('principal', [
+            'INSERT INTO t (a) VALUES (1)',
+            'INSERT INTO t (a) VALUES (2)',
+            'UPDATE t SET a = 2 WHERE a = 1',
+        ])
+
+    with manager.get_engine('principal').connect() as connection:
+        count = connection.execute(text('SELECT COUNT(*) FROM t'))
+        assert count.scalar() == 0
+    manager.close_all_connections()
+
+
+def test_aexecute_many_inserts_rows(tmp_path):
+    manager = _sqlite_manager(tmp_path, async_mode=True)
+
+    async def main():
+        await manager.aexecute_many('principal', [
+            'CREATE TABLE t (a INTEGER)',
+            *(f'INSERT INTO t (a) VALUES ({i})' for i in range(10)),
+        ])
+        async with manager.get_async_session('principal') as session:
+            total = await session.execute(text('SELECT SUM(a) FROM t'))
+            assert total.scalar() == 45
+        await manager.aclose_all_connections()
+
+    asyncio.run(main())
+
+
+def test_add_connections_registers_nothing_when_a_driver_is_missing(
+    tmp_path,
+):
+    if importlib.util.find_spec('pymysql') is not None:
+        pytest.skip('pymysql está instalado')
+    manager = _sqlite_manager(tmp_path)
+
+    with pytest.raises(ImportError):
+        manager.add_connections([
+            {'name': 'novo', 'dialect': 'sqlite', 'database': ':memory:'},
+            {'name': 'mysql', 'dialect': 'mysql+pymysql', 'database': 'x'},
+        ])
+
+    assert list(manager.connections) == ['principal']
+    manager.close_all_connections()